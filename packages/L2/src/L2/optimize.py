@@ -129,12 +129,12 @@ def _flatten_begin(effects: list[Term], value: Term) -> Term:
         flat_effects.extend(value.effects)
         value = value.value
 
-    flat_effects = [effect for effect in flat_effects if _has_effect(effect)]
+    kept_effects = tuple(effect for effect in flat_effects if _has_effect(effect))
 
-    if not flat_effects:
+    if not kept_effects:
         return value
 
-    return Begin(effects=flat_effects, value=value)
+    return Begin(effects=kept_effects, value=value)
 
 
 def _optimize_term(term: Term, env: Mapping[str, Constant]) -> Term:
@@ -154,7 +154,7 @@ def _optimize_term(term: Term, env: Mapping[str, Constant]) -> Term:
         case Apply(target=target, arguments=arguments):
             return Apply(
                 target=_optimize_term(target, env),
-                arguments=[_optimize_term(argument, env) for argument in arguments],
+                arguments=tuple(_optimize_term(argument, env) for argument in arguments),
             )
 
         case Primitive(operator=operator, left=left, right=right):
@@ -103,9 +103,7 @@ def test_cps_convert_term_abstract():
 def test_cps_convert_term_apply():
     term = L2.Apply(
         target=L2.Reference(name="f"),
-        arguments=[
-            L2.Reference(name="y"),
-        ],
+        arguments=(L2.Reference(name="y"),),
     )
 
     fresh = SequentialNameGenerator()
@@ -218,9 +216,7 @@ def test_cps_convert_term_store():
 
 def test_cps_convert_term_begin():
     term = L2.Begin(
-        effects=[
-            L2.Reference(name="x"),
-        ],
+        effects=(L2.Reference(name="x"),),
         value=L2.Reference(name="y"),
     )
 
@@ -125,22 +125,22 @@ def test_has_effect_all_cases():
         Let(bindings=[("x", Immediate(value=1))], body=Reference(name="x"))
     ) is False
 
-    assert _has_effect(Begin(effects=[], value=Immediate(value=0))) is False
-    assert _has_effect(Begin(effects=[Immediate(value=1)], value=Immediate(value=2))) is True
+    assert _has_effect(Begin(effects=(), value=Immediate(value=0))) is False
+    assert _has_effect(Begin(effects=(Immediate(value=1),), value=Immediate(value=2))) is True
     assert _has_effect(
         Begin(
-            effects=[Store(base=Allocate(count=1), index=0, value=Immediate(value=1))],
+            effects=(Store(base=Allocate(count=1), index=0, value=Immediate(value=1)),),
             value=Immediate(value=2),
         )
     ) is True
     assert _has_effect(
         Begin(
-            effects=[],
+            effects=(),
             value=Store(base=Allocate(count=1), index=0, value=Immediate(value=1)),
         )
     ) is True
 
-    assert _has_effect(Apply(target=Reference(name="f"), arguments=[])) is True
+    assert _has_effect(Apply(target=Reference(name="f"), arguments=())) is True
     assert _has_effect(
         Store(base=Allocate(count=1), index=0, value=Immediate(value=1))
     ) is True
@@ -165,14 +165,14 @@ def test_free_variables_all_cases():
     assert _free_variables(
         Apply(
             target=Reference(name="f"),
-            arguments=[
+            arguments=(
                 Reference(name="x"),
                 Primitive(
                     operator="+",
                     left=Reference(name="y"),
                     right=Immediate(value=1),
                 ),
-            ],
+            ),
         )
     ) == {"f", "x", "y"}
 
@@ -197,10 +197,10 @@ def test_free_variables_all_cases():
 
     assert _free_variables(
         Begin(
-            effects=[
+            effects=(
                 Reference(name="u"),
                 Store(base=Reference(name="a"), index=0, value=Reference(name="b")),
-            ],
+            ),
             value=Reference(name="v"),
         )
     ) == {"u", "a", "b", "v"}
@@ -235,22 +235,22 @@ def test_extend_env_and_flatten_begin():
         [
             Immediate(value=1),
             Begin(
-                effects=[
+                effects=(
                     Immediate(value=2),
                     Store(base=Allocate(count=1), index=0, value=Immediate(value=3)),
-                ],
+                ),
                 value=Immediate(value=4),
             ),
         ],
         Begin(
-            effects=[Store(base=Allocate(count=1), index=0, value=Immediate(value=5))],
+            effects=(Store(base=Allocate(count=1), index=0, value=Immediate(value=5)),),
             value=Immediate(value=6),
         ),
     ) == Begin(
-        effects=[
+        effects=(
             Store(base=Allocate(count=1), index=0, value=Immediate(value=3)),
             Store(base=Allocate(count=1), index=0, value=Immediate(value=5)),
-        ],
+        ),
         value=Immediate(value=6),
     )
 
@@ -275,15 +275,15 @@ def test_optimize_term_main_paths():
     assert _optimize_term(
         Apply(
             target=Reference(name="f"),
-            arguments=[
+            arguments=(
                 Primitive(operator="+", left=Immediate(value=2), right=Immediate(value=3)),
                 Reference(name="x"),
-            ],
+            ),
         ),
         {"f": Reference(name="g"), "x": Immediate(value=9)},
     ) == Apply(
         target=Reference(name="g"),
-        arguments=[Immediate(value=5), Immediate(value=9)],
+        arguments=(Immediate(value=5), Immediate(value=9)),
     )
 
     assert _optimize_term(
@@ -374,30 +374,30 @@ def test_optimize_term_main_paths():
 
     assert _optimize_term(
         Begin(
-            effects=[
+            effects=(
                 Immediate(value=1),
                 Begin(
-                    effects=[
+                    effects=(
                         Immediate(value=2),
                         Store(base=Allocate(count=1), index=0, value=Immediate(value=9)),
-                    ],
+                    ),
                     value=Immediate(value=3),
                 ),
-            ],
+            ),
             value=Begin(
-                effects=[
+                effects=(
                     Immediate(value=4),
                     Store(base=Allocate(count=1), index=0, value=Immediate(value=8)),
-                ],
+                ),
                 value=Immediate(value=5),
             ),
         ),
         {},
     ) == Begin(
-        effects=[
+        effects=(
             Store(base=Allocate(count=1), index=0, value=Immediate(value=9)),
             Store(base=Allocate(count=1), index=0, value=Immediate(value=8)),
-        ],
+        ),
         value=Immediate(value=5),
     )
 
@@ -436,7 +436,7 @@ def test_optimize_term_main_paths():
         ),
         {},
     ) == Begin(
-        effects=[Store(base=Allocate(count=1), index=0, value=Immediate(value=42))],
+        effects=(Store(base=Allocate(count=1), index=0, value=Immediate(value=42)),),
         value=Immediate(value=7),
     )
 
@@ -458,7 +458,7 @@ def test_optimize_term_main_paths():
         ),
         {},
     ) == Begin(
-        effects=[Store(base=Reference(name="arr"), index=0, value=Reference(name="val"))],
+        effects=(Store(base=Reference(name="arr"), index=0, value=Reference(name="val")),),
         value=Immediate(value=0),
     )
 
@@ -475,7 +475,7 @@ def test_optimize_term_main_paths():
     assert _optimize_term(
         Let(
             bindings=[
-                ("x", Begin(effects=[Reference(name="u")], value=Reference(name="v"))),
+                ("x", Begin(effects=(Reference(name="u"),), value=Reference(name="v"))),
             ],
             body=Reference(name="x"),
         ),
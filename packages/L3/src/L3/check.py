@@ -1,5 +1,7 @@
 from collections import Counter
-from collections.abc import Mapping
+from collections.abc import Callable, Collection
+from collections.abc import Set as AbstractSet
+from typing import Any
 
 from .syntax import (
     Abstract,
@@ -19,7 +21,95 @@ from .syntax import (
     Term,
 )
 
-type Context = Mapping[Identifier, None]
+type Context = AbstractSet[Identifier]
+
+# the walk's own view of a context: only membership is asked of it
+type Scope = frozenset[Identifier]
+
+
+def _declare(names: Collection[Identifier], kind: str) -> frozenset[Identifier]:
+    local = frozenset(names)
+    if len(local) != len(names):
+        # only pay for counting once we know there is something to report
+        duplicate = next(name for name, count in Counter(names).items() if count > 1)
+        raise ValueError(f"duplicate {kind}: {duplicate}")
+    return local
+
+
+type Stack = list[tuple[Term, Scope]]
+
+
+def _check_let(term: Let, context: Scope, stack: Stack) -> None:
+    local = _declare([name for name, _ in term.bindings], "binder")
+
+    stack.append((term.body, context.union(local)))
+
+    # parallel let: each RHS sees only the incoming context
+    for _, value in reversed(term.bindings):
+        stack.append((value, context))
+
+
+def _check_letrec(term: LetRec, context: Scope, stack: Stack) -> None:
+    local = _declare([name for name, _ in term.bindings], "binder")
+    inner = context.union(local)
+
+    stack.append((term.body, inner))
+
+    # letrec RHS sees all binders
+    for _name, value in reversed(term.bindings):
+        stack.append((value, inner))
+
+
+def _check_abstract(term: Abstract, context: Scope, stack: Stack) -> None:
+    local = _declare(term.parameters, "parameter")
+
+    stack.append((term.body, context.union(local)))
+
+
+def _check_apply(term: Apply, context: Scope, stack: Stack) -> None:
+    for argument in reversed(term.arguments):
+        stack.append((argument, context))
+    stack.append((term.target, context))
+
+
+def _check_primitive(term: Primitive, context: Scope, stack: Stack) -> None:
+    stack.append((term.right, context))
+    stack.append((term.left, context))
+
+
+def _check_branch(term: Branch, context: Scope, stack: Stack) -> None:
+    stack.append((term.otherwise, context))
+    stack.append((term.consequent, context))
+    stack.append((term.right, context))
+    stack.append((term.left, context))
+
+
+def _check_load(term: Load, context: Scope, stack: Stack) -> None:
+    stack.append((term.base, context))
+
+
+def _check_store(term: Store, context: Scope, stack: Stack) -> None:
+    stack.append((term.value, context))
+    stack.append((term.base, context))
+
+
+def _check_begin(term: Begin, context: Scope, stack: Stack) -> None:
+    stack.append((term.value, context))
+    for effect in reversed(term.effects):
+        stack.append((effect, context))
+
+
+_HANDLERS: dict[type, Callable[[Any, Scope, Stack], None]] = {
+    Let: _check_let,
+    LetRec: _check_letrec,
+    Abstract: _check_abstract,
+    Apply: _check_apply,
+    Primitive: _check_primitive,
+    Branch: _check_branch,
+    Load: _check_load,
+    Store: _check_store,
+    Begin: _check_begin,
+}
 
 
 def check_term(
@@ -43,85 +133,33 @@ def check_term(
       It only ensures that variable binding structure is well-formed.
 
     Traversal strategy:
-    - Structural recursion: recursively visits sub-terms to ensure checks apply everywhere.
-    - `recur` is a convenience wrapper that reuses the same `context`.
+    - Iterative: a work stack of `(term, context)` pairs replaces recursion, so deep
+      terms neither pay for a Python frame per node nor hit the recursion limit.
+      Children are pushed in reverse so they are still checked left to right.
+    - Dispatch goes through `_HANDLERS`, keyed on the concrete node class, so each
+      node costs one dict lookup instead of a linear walk over `match` patterns.
     """
-    def recur(t: Term, *, ctx: Context = context) -> None:
-        check_term(t, ctx)
-
-    match term:
-        case Let(bindings=bindings, body=body):
-            counts = Counter(name for name, _ in bindings)
-            duplicates = {name: count for name, count in counts.items() if count > 1}
-            if duplicates:
-                raise ValueError(f"duplicate binders: {duplicates}")
-
-            # parallel let: each RHS sees only the incoming context
-            for _, value in bindings:
-                recur(value, ctx=context)
-
-            local = dict.fromkeys([name for name, _ in bindings], None)
-            recur(body, ctx={**context, **local})
-
-        case LetRec(bindings=bindings, body=body):
-            counts = Counter(name for name, _ in bindings)
-            duplicates = {name: count for name, count in counts.items() if count > 1}
-            if duplicates:
-                raise ValueError(f"duplicate binders: {duplicates}")
-
-            local = dict.fromkeys([name for name, _ in bindings], None)
-
-            # letrec RHS sees all binders
-            for _name, value in bindings:
-                recur(value, ctx={**context, **local})
-
-            recur(body, ctx={**context, **local})
-
-        case Reference(name=name):
-            if name not in context:
-                raise ValueError(f"unknown variable: {name}")
-
-        case Abstract(parameters=parameters, body=body):
-            counts = Counter(parameters)
-            duplicates = {name for name, count in counts.items() if count > 1}
-            if duplicates:
-                raise ValueError(f"duplicate parameters: {duplicates}")
-
-            local = dict.fromkeys(parameters, None)
-            recur(body, ctx={**context, **local})
-
-        case Apply(target=target, arguments=arguments):
-            recur(target, ctx=context)
-            for argument in arguments:
-                recur(argument, ctx=context)
-
-        case Immediate(value=_value):
-            return
-
-        case Primitive(operator=_operator, left=left, right=right):
-            recur(left, ctx=context)
-            recur(right, ctx=context)
-
-        case Branch(operator=_operator, left=left, right=right, consequent=consequent, otherwise=otherwise):
-            recur(left, ctx=context)
-            recur(right, ctx=context)
-            recur(consequent, ctx=context)
-            recur(otherwise, ctx=context)
-
-        case Allocate(count=_count):
-            return
-
-        case Load(base=base, index=_index):
-            recur(base, ctx=context)
-
-        case Store(base=base, index=_index, value=value):
-            recur(base, ctx=context)
-            recur(value, ctx=context)
-
-        case Begin(effects=effects, value=value):  # pragma: no branch
-            for effect in effects:
-                recur(effect, ctx=context)
-            recur(value, ctx=context)
+    stack: Stack = [(term, frozenset(context))]
+
+    # hoist the per-node globals into locals (LOAD_FAST)
+    handlers = _HANDLERS
+    pop = stack.pop
+    reference, immediate, allocate = Reference, Immediate, Allocate
+
+    while stack:
+        term, context = pop()
+        kind = type(term)
+        # leaves dominate node counts; settle them before the table lookup
+        if kind is reference:
+            if term.name not in context:
+                raise ValueError(f"unknown variable: {term.name}")
+            continue
+        if kind is immediate or kind is allocate:
+            continue
+        handler = handlers.get(kind)
+        if handler is None:
+            raise TypeError(f"Unhandled L3 term in check_term: {term!r}")
+        handler(term, context, stack)
 
 
 def check_program(
@@ -129,10 +167,4 @@ def check_program(
 ) -> None:
     match program:
         case Program(parameters=parameters, body=body):  # pragma: no branch
-            counts = Counter(parameters)
-            duplicates = {name for name, count in counts.items() if count > 1}
-            if duplicates:
-                raise ValueError(f"duplicate parameters: {duplicates}")
-
-            local = dict.fromkeys(parameters, None)
-            check_term(body, context=local)
\ No newline at end of file
+            check_term(body, context=_declare(parameters, "parameter"))
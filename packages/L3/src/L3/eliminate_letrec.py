@@ -1,12 +1,199 @@
-# noqa: F841
-from collections.abc import Mapping
-from functools import partial
+from collections.abc import Callable
+from collections.abc import Set as AbstractSet
+from typing import Any
 
 from L2 import syntax as L2
 
 from . import syntax as L3
 
-type Context = Mapping[L3.Identifier, None]
+type Context = AbstractSet[L3.Identifier]
+
+# the walk's own view of a context: frozen so it can key the memo
+type Scope = frozenset[L3.Identifier]
+
+# A pending visit has `build=None`; once a node's children have been queued, the
+# node is pushed again with the builder that assembles its L2 form from `values`.
+type Build = Callable[[Any, list[L2.Term]], L2.Term]
+type Stack = list[tuple[L3.Term, Scope, Build | None]]
+
+# L2 nodes are frozen, so every letrec cell can share one allocation node
+_ALLOCATE_CELL = L2.Allocate(count=1)
+
+
+def _pop_many(values: list[L2.Term], count: int) -> tuple[L2.Term, ...]:
+    start = len(values) - count
+    items = tuple(values[start:])
+    del values[start:]
+    return items
+
+
+def _build_let(term: L3.Let, values: list[L2.Term]) -> L2.Term:
+    body = values.pop()
+    new_values = _pop_many(values, len(term.bindings))
+    return L2.Let(
+        bindings=[(name, value) for (name, _), value in zip(term.bindings, new_values)],
+        body=body,
+    )
+
+
+def _eliminate_let(term: L3.Let, context: Scope, stack: Stack) -> None:
+    # parallel let: RHS do not see same-let binders (handled by the checker).
+    stack.append((term, context, _build_let))
+    stack.append((term.body, context, None))
+    for _, value in reversed(term.bindings):
+        stack.append((value, context, None))
+
+
+def _build_letrec(term: L3.LetRec, values: list[L2.Term]) -> L2.Term:
+    new_body = values.pop()
+    new_values = _pop_many(values, len(term.bindings))
+
+    # 1) allocate a 1-slot cell for each binder
+    alloc_bindings: list[tuple[L3.Identifier, L2.Term]] = [(name, _ALLOCATE_CELL) for name, _ in term.bindings]
+
+    # 2) store each RHS into its cell
+    effects = tuple(
+        L2.Store(
+            base=L2.Reference(name=name),
+            index=0,
+            value=value,
+        )
+        for (name, _), value in zip(term.bindings, new_values)
+    )
+
+    return L2.Let(
+        bindings=alloc_bindings,
+        body=L2.Begin(effects=effects, value=new_body),
+    )
+
+
+def _eliminate_letrec(term: L3.LetRec, context: Scope, stack: Stack) -> None:
+    # letrec elimination:
+    #   letrec x = v in b
+    #     => let x = allocate(1) in begin store(x[0], v'); b'
+    rec_ctx = context.union(name for name, _ in term.bindings)
+
+    # RHS and body are both translated under the recursive context
+    stack.append((term, context, _build_letrec))
+    stack.append((term.body, rec_ctx, None))
+    for _, value in reversed(term.bindings):
+        stack.append((value, rec_ctx, None))
+
+
+def _build_abstract(term: L3.Abstract, values: list[L2.Term]) -> L2.Term:
+    return L2.Abstract(
+        parameters=term.parameters,
+        body=values.pop(),
+    )
+
+
+def _eliminate_abstract(term: L3.Abstract, context: Scope, stack: Stack) -> None:
+    stack.append((term, context, _build_abstract))
+    stack.append((term.body, context, None))
+
+
+def _build_apply(term: L3.Apply, values: list[L2.Term]) -> L2.Term:
+    arguments = _pop_many(values, len(term.arguments))
+    return L2.Apply(
+        target=values.pop(),
+        arguments=arguments,
+    )
+
+
+def _eliminate_apply(term: L3.Apply, context: Scope, stack: Stack) -> None:
+    stack.append((term, context, _build_apply))
+    for argument in reversed(term.arguments):
+        stack.append((argument, context, None))
+    stack.append((term.target, context, None))
+
+
+def _build_primitive(term: L3.Primitive, values: list[L2.Term]) -> L2.Term:
+    right = values.pop()
+    return L2.Primitive(
+        operator=term.operator,
+        left=values.pop(),
+        right=right,
+    )
+
+
+def _eliminate_primitive(term: L3.Primitive, context: Scope, stack: Stack) -> None:
+    stack.append((term, context, _build_primitive))
+    stack.append((term.right, context, None))
+    stack.append((term.left, context, None))
+
+
+def _build_branch(term: L3.Branch, values: list[L2.Term]) -> L2.Term:
+    left, right, consequent, otherwise = _pop_many(values, 4)
+    return L2.Branch(
+        operator=term.operator,
+        left=left,
+        right=right,
+        consequent=consequent,
+        otherwise=otherwise,
+    )
+
+
+def _eliminate_branch(term: L3.Branch, context: Scope, stack: Stack) -> None:
+    stack.append((term, context, _build_branch))
+    stack.append((term.otherwise, context, None))
+    stack.append((term.consequent, context, None))
+    stack.append((term.right, context, None))
+    stack.append((term.left, context, None))
+
+
+def _build_load(term: L3.Load, values: list[L2.Term]) -> L2.Term:
+    return L2.Load(
+        base=values.pop(),
+        index=term.index,
+    )
+
+
+def _eliminate_load(term: L3.Load, context: Scope, stack: Stack) -> None:
+    stack.append((term, context, _build_load))
+    stack.append((term.base, context, None))
+
+
+def _build_store(term: L3.Store, values: list[L2.Term]) -> L2.Term:
+    value = values.pop()
+    return L2.Store(
+        base=values.pop(),
+        index=term.index,
+        value=value,
+    )
+
+
+def _eliminate_store(term: L3.Store, context: Scope, stack: Stack) -> None:
+    stack.append((term, context, _build_store))
+    stack.append((term.value, context, None))
+    stack.append((term.base, context, None))
+
+
+def _build_begin(term: L3.Begin, values: list[L2.Term]) -> L2.Term:
+    value = values.pop()
+    return L2.Begin(
+        effects=_pop_many(values, len(term.effects)),
+        value=value,
+    )
+
+
+def _eliminate_begin(term: L3.Begin, context: Scope, stack: Stack) -> None:
+    stack.append((term, context, _build_begin))
+    stack.append((term.value, context, None))
+    for effect in reversed(term.effects):
+        stack.append((effect, context, None))
+
+
+_HANDLERS: dict[type, Callable[[Any, Scope, Stack], None]] = {
+    L3.Let: _eliminate_let,
+    L3.LetRec: _eliminate_letrec,
+    L3.Abstract: _eliminate_abstract,
+    L3.Apply: _eliminate_apply,
+    L3.Primitive: _eliminate_primitive,
+    L3.Branch: _eliminate_branch,
+    L3.Load: _eliminate_load,
+    L3.Store: _eliminate_store,
+    L3.Begin: _eliminate_begin,
+}
 
 
 def eliminate_letrec_term(
@@ -18,115 +205,58 @@ def eliminate_letrec_term(
 
     `context` tracks the set of recursive variables currently in scope.
     Any `Reference(name)` where `name in context` becomes `Load(Reference(name), 0)`.
-    """
-    recur = partial(eliminate_letrec_term, context=context)
-
-    match term:
-        case L3.Let(bindings=bindings, body=body):
-            # parallel let: RHS do not see same-let binders (handled by the checker).
-            new_bindings: list[tuple[L3.Identifier, L2.Term]] = []
-            for name, value in bindings:
-                new_bindings.append((name, recur(value)))
-
-            return L2.Let(
-                bindings=new_bindings,
-                body=eliminate_letrec_term(body, context=context),
-            )
-
-        case L3.LetRec(bindings=bindings, body=body):
-            # letrec elimination:
-            #   letrec x = v in b
-            #     => let x = allocate(1) in begin store(x[0], v'); b'
-            rec_names = [name for name, _ in bindings]
-            rec_ctx: dict[L3.Identifier, None] = {**context, **dict.fromkeys(rec_names, None)}
-
-            # 1) allocate a 1-slot cell for each binder
-            alloc_bindings: list[tuple[L3.Identifier, L2.Term]] = [
-                (name, L2.Allocate(count=1)) for name, _ in bindings
-            ]
-
-            # 2) store each RHS into its cell
-            effects: list[L2.Term] = []
-            for name, value in bindings:
-                effects.append(
-                    L2.Store(
-                        base=L2.Reference(name=name),
-                        index=0,
-                        value=eliminate_letrec_term(value, context=rec_ctx),
-                    )
-                )
-
-            # 3) translate body under recursive context
-            new_body = eliminate_letrec_term(body, context=rec_ctx)
-
-            return L2.Let(
-                bindings=alloc_bindings,
-                body=L2.Begin(effects=effects, value=new_body),
-            )
-
-        case L3.Reference(name=name):
-            # recursive var => load(name[0]); otherwise plain reference
-            if name in context:
-                return L2.Load(
-                    base=L2.Reference(name=name),
-                    index=0,
-                )
-            return L2.Reference(name=name)
-
-        case L3.Abstract(parameters=parameters, body=body):
-            return L2.Abstract(
-                parameters=parameters,
-                body=eliminate_letrec_term(body, context=context),
-            )
-
-        case L3.Apply(target=target, arguments=arguments):
-            return L2.Apply(
-                target=recur(target),
-                arguments=[recur(a) for a in arguments],
-            )
 
-        case L3.Immediate(value=value):
-            return L2.Immediate(value=value)
-
-        case L3.Primitive(operator=operator, left=left, right=right):
-            return L2.Primitive(
-                operator=operator,
-                left=recur(left),
-                right=recur(right),
-            )
-
-        case L3.Branch(operator=operator, left=left, right=right, consequent=consequent, otherwise=otherwise):
-            return L2.Branch(
-                operator=operator,
-                left=recur(left),
-                right=recur(right),
-                consequent=recur(consequent),
-                otherwise=recur(otherwise),
-            )
+    The walk is an iterative post-order over an explicit stack: visiting a node
+    queues its builder and then its children, and the builder later pops the
+    translated children off `values` to assemble the L2 node.
 
-        case L3.Allocate(count=count):
-            return L2.Allocate(count=count)
-
-        case L3.Load(base=base, index=index):
-            return L2.Load(
-                base=recur(base),
-                index=index,
-            )
-
-        case L3.Store(base=base, index=index, value=value):
-            return L2.Store(
-                base=recur(base),
-                index=index,
-                value=recur(value),
-            )
+    Composite results are memoised per call on `(id(term), scope)`, so a subtree
+    shared within `term` is translated once per scope and its L2 node is reused.
+    Identity keys are safe because `term` keeps every node alive for the call.
+    """
+    stack: Stack = [(term, frozenset(context), None)]
+    values: list[L2.Term] = []
+    memo: dict[tuple[int, Scope], L2.Term] = {}
 
-        case L3.Begin(effects=effects, value=value):  # pragma: no branch
-            return L2.Begin(
-                effects=[recur(e) for e in effects],
-                value=recur(value),
-            )
+    # hoist everything the loop touches per node into locals (LOAD_FAST)
+    handlers = _HANDLERS
+    pop = stack.pop
+    push_value = values.append
+    lookup = memo.get
+    reference, immediate, allocate = L3.Reference, L3.Immediate, L3.Allocate
+    make_reference, make_load = L2.Reference, L2.Load
+    make_immediate, make_allocate = L2.Immediate, L2.Allocate
 
-    raise TypeError(f"Unhandled L3 term in eliminate_letrec_term: {term!r}")
+    while stack:
+        term, context, build = pop()
+        if build is not None:
+            result = memo[id(term), context] = build(term, values)
+            push_value(result)
+            continue
+        kind = type(term)
+        # leaves dominate node counts; build them before the memo and table lookups
+        if kind is reference:
+            # recursive var => load(name[0]); otherwise plain reference
+            if term.name in context:
+                push_value(make_load(base=make_reference(name=term.name), index=0))
+            else:
+                push_value(make_reference(name=term.name))
+            continue
+        if kind is immediate:
+            push_value(make_immediate(value=term.value))
+            continue
+        if kind is allocate:
+            push_value(make_allocate(count=term.count))
+            continue
+        cached = lookup((id(term), context))
+        if cached is not None:
+            push_value(cached)
+            continue
+        handler = handlers.get(kind)
+        if handler is None:
+            raise TypeError(f"Unhandled L3 term in eliminate_letrec_term: {term!r}")
+        handler(term, context, stack)
+    return values.pop()
 
 
 def eliminate_letrec_program(
@@ -136,5 +266,5 @@ def eliminate_letrec_program(
         case L3.Program(parameters=parameters, body=body):  # pragma: no branch
             return L2.Program(
                 parameters=parameters,
-                body=eliminate_letrec_term(body, {}),
-            )
\ No newline at end of file
+                body=eliminate_letrec_term(body, frozenset()),
+            )
@@ -1,3 +1,4 @@
+import sys
 from collections.abc import Sequence
 from pathlib import Path
 
@@ -25,7 +26,8 @@ from .syntax import (
 
 class AstTransformer(Transformer[Token, Program | Term]):
     def IDENTIFIER(self, t: Token) -> Identifier:
-        return str(t)
+        # interned so that later scope lookups compare names by identity
+        return sys.intern(str(t))
 
     def INT(self, t: Token) -> int:
         return int(t)
@@ -66,7 +68,7 @@ class AstTransformer(Transformer[Token, Program | Term]):
 
     @v_args(inline=True)
     def apply(self, target: Term, *arguments: Term) -> Term:
-        return Apply(target=target, arguments=list(arguments))
+        return Apply(target=target, arguments=arguments)
 
     @v_args(inline=True)
     def immediate(self, value: int) -> Term:
@@ -105,8 +107,7 @@ class AstTransformer(Transformer[Token, Program | Term]):
 
     @v_args(inline=True)
     def begin(self, _begin: Token, *terms: Term) -> Term:
-        ts = list(terms)
-        return Begin(effects=ts[:-1], value=ts[-1])
+        return Begin(effects=terms[:-1], value=terms[-1])
 
 
 def parse_term(source: str) -> Term:
@@ -120,4 +121,4 @@ def parse_program(source: str) -> Program:
     grammar = Path(__file__).with_name("L3.lark").read_text()
     parser = Lark(grammar, start="program", parser="lalr")
     tree = parser.parse(source)
-    return AstTransformer().transform(tree)
\ No newline at end of file
+    return AstTransformer().transform(tree)
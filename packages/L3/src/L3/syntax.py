@@ -46,7 +46,7 @@ class Abstract(BaseModel, frozen=True):
 class Apply(BaseModel, frozen=True):
     tag: Literal["apply"] = "apply"
     target: Term
-    arguments: Sequence[Term]
+    arguments: tuple[Term, ...]
 
 
 class Immediate(BaseModel, frozen=True):
@@ -90,5 +90,5 @@ class Store(BaseModel, frozen=True):
 
 class Begin(BaseModel, frozen=True):
     tag: Literal["begin"] = "begin"
-    effects: Sequence[Term]
+    effects: tuple[Term, ...]
     value: Term
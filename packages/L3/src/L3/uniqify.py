@@ -1,5 +1,4 @@
 from collections.abc import Callable, Mapping
-from functools import partial
 
 from util.sequential_name_generator import SequentialNameGenerator
 
@@ -28,17 +27,12 @@ def uniqify_term(
     context: Context,
     fresh: Callable[[str], str],
 ) -> Term:
-    _term = partial(uniqify_term, context=context, fresh=fresh)
-
     match term:
         case Let(bindings=bindings, body=body):
             renamed = {name: fresh(name) for name, _ in bindings}
             body_context = dict(context) | renamed
             return Let(
-                bindings=[
-                    (renamed[name], _term(value))
-                    for name, value in bindings
-                ],
+                bindings=[(renamed[name], uniqify_term(value, context, fresh)) for name, value in bindings],
                 body=uniqify_term(body, body_context, fresh),
             )
 
@@ -46,10 +40,7 @@ def uniqify_term(
             renamed = {name: fresh(name) for name, _ in bindings}
             next_context = dict(context) | renamed
             return LetRec(
-                bindings=[
-                    (renamed[name], uniqify_term(value, next_context, fresh))
-                    for name, value in bindings
-                ],
+                bindings=[(renamed[name], uniqify_term(value, next_context, fresh)) for name, value in bindings],
                 body=uniqify_term(body, next_context, fresh),
             )
 
@@ -66,38 +57,46 @@ def uniqify_term(
 
         case Apply(target=target, arguments=arguments):
             return Apply(
-                target=_term(target),
-                arguments=[_term(argument) for argument in arguments],
+                target=uniqify_term(target, context, fresh),
+                arguments=tuple(uniqify_term(argument, context, fresh) for argument in arguments),
             )
 
         case Immediate():
             return term
 
         case Primitive(operator=operator, left=left, right=right):
-            return Primitive(operator=operator, left=_term(left), right=_term(right))
+            return Primitive(
+                operator=operator,
+                left=uniqify_term(left, context, fresh),
+                right=uniqify_term(right, context, fresh),
+            )
 
         case Branch(operator=operator, left=left, right=right, consequent=consequent, otherwise=otherwise):
             return Branch(
                 operator=operator,
-                left=_term(left),
-                right=_term(right),
-                consequent=_term(consequent),
-                otherwise=_term(otherwise),
+                left=uniqify_term(left, context, fresh),
+                right=uniqify_term(right, context, fresh),
+                consequent=uniqify_term(consequent, context, fresh),
+                otherwise=uniqify_term(otherwise, context, fresh),
             )
 
         case Allocate():
             return term
 
         case Load(base=base, index=index):
-            return Load(base=_term(base), index=index)
+            return Load(base=uniqify_term(base, context, fresh), index=index)
 
         case Store(base=base, index=index, value=value):
-            return Store(base=_term(base), index=index, value=_term(value))
+            return Store(
+                base=uniqify_term(base, context, fresh),
+                index=index,
+                value=uniqify_term(value, context, fresh),
+            )
 
         case Begin(effects=effects, value=value):  # pragma: no branch
             return Begin(
-                effects=[_term(effect) for effect in effects],
-                value=_term(value),
+                effects=tuple(uniqify_term(effect, context, fresh) for effect in effects),
+                value=uniqify_term(value, context, fresh),
             )
 
     raise TypeError(f"Unhandled L3 term in uniqify_term: {term!r}")
@@ -108,8 +107,6 @@ def uniqify_program(
 ) -> tuple[Callable[[str], str], Program]:
     fresh = SequentialNameGenerator()
 
-    _term = partial(uniqify_term, fresh=fresh)
-
     match program:
         case Program(parameters=parameters, body=body):  # pragma: no branch
             local = {parameter: fresh(parameter) for parameter in parameters}
@@ -117,6 +114,6 @@ def uniqify_program(
                 fresh,
                 Program(
                     parameters=[local[parameter] for parameter in parameters],
-                    body=_term(body, local),
+                    body=uniqify_term(body, local, fresh),
                 ),
             )
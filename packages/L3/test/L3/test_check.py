@@ -25,7 +25,7 @@ def test_check_term_let():
         body=Reference(name="x"),
     )
 
-    context: Context = {}
+    context: Context = set()
 
     check_term(term, context)
 
@@ -39,7 +39,21 @@ def test_check_term_let_scope():
         body=Reference(name="y"),
     )
 
-    context: Context = {}
+    context: Context = set()
+
+    with pytest.raises(ValueError):
+        check_term(term, context)
+
+
+def test_check_term_let_body_free():
+    term = Let(
+        bindings=[
+            ("x", Immediate(value=0)),
+        ],
+        body=Reference(name="y"),
+    )
+
+    context: Context = set()
 
     with pytest.raises(ValueError):
         check_term(term, context)
@@ -54,7 +68,7 @@ def test_check_term_let_duplicate_binders():
         body=Reference(name="x"),
     )
 
-    context: Context = {}
+    context: Context = set()
 
     with pytest.raises(ValueError):
         check_term(term, context)
@@ -68,7 +82,7 @@ def test_check_term_letrec():
         body=Reference(name="x"),
     )
 
-    context: Context = {}
+    context: Context = set()
 
     check_term(term, context)
 
@@ -82,7 +96,7 @@ def test_check_term_letrec_scope():
         body=Reference(name="x"),
     )
 
-    context: Context = {}
+    context: Context = set()
 
     check_term(term, context)
 
@@ -96,18 +110,80 @@ def test_check_term_letrec_duplicate_binders():
         body=Reference(name="x"),
     )
 
-    context: Context = {}
+    context: Context = set()
 
     with pytest.raises(ValueError):
         check_term(term, context)
 
 
+def test_check_term_nested_scopes():
+    term = Let(
+        bindings=[
+            ("x", Immediate(value=0)),
+        ],
+        body=LetRec(
+            bindings=[
+                ("f", Abstract(parameters=["y"], body=Reference(name="x"))),
+            ],
+            body=Apply(target=Reference(name="f"), arguments=(Reference(name="x"),)),
+        ),
+    )
+
+    context: Context = set()
+
+    check_term(term, context)
+
+
+def test_check_term_reports_leftmost_unbound_reference():
+    term = Primitive(
+        operator="+",
+        left=Reference(name="a"),
+        right=Reference(name="b"),
+    )
+
+    context: Context = set()
+
+    with pytest.raises(ValueError, match="unknown variable: a"):
+        check_term(term, context)
+
+
+def test_check_term_let_reports_binding_before_body():
+    term = Let(
+        bindings=[
+            ("x", Reference(name="a")),
+        ],
+        body=Reference(name="b"),
+    )
+
+    context: Context = set()
+
+    with pytest.raises(ValueError, match="unknown variable: a"):
+        check_term(term, context)
+
+
+def test_check_term_reports_left_subtree_before_right_leaf():
+    term = Primitive(
+        operator="+",
+        left=Let(
+            bindings=[
+                ("x", Immediate(value=0)),
+                ("x", Immediate(value=1)),
+            ],
+            body=Reference(name="x"),
+        ),
+        right=Reference(name="b"),
+    )
+
+    context: Context = set()
+
+    with pytest.raises(ValueError, match="duplicate binder: x"):
+        check_term(term, context)
+
+
 def test_check_term_reference_bound():
     term = Reference(name="x")
 
-    context: Context = {
-        "x": None,
-    }
+    context: Context = {"x"}
 
     check_term(term, context)
 
@@ -115,7 +191,7 @@ def test_check_term_reference_bound():
 def test_check_term_reference_free():
     term = Reference(name="x")
 
-    context: Context = {}
+    context: Context = set()
 
     with pytest.raises(ValueError):
         check_term(term, context)
@@ -127,7 +203,7 @@ def test_check_term_abstract():
         body=Immediate(value=0),
     )
 
-    context: Context = {}
+    context: Context = set()
 
     check_term(term, context)
 
@@ -138,7 +214,7 @@ def test_check_term_abstract_duplicate_parameters():
         body=Immediate(value=0),
     )
 
-    context: Context = {}
+    context: Context = set()
 
     with pytest.raises(ValueError):
         check_term(term, context)
@@ -147,12 +223,10 @@ def test_check_term_abstract_duplicate_parameters():
 def test_check_term_apply():
     term = Apply(
         target=Reference(name="x"),
-        arguments=[Immediate(value=0)],
+        arguments=(Immediate(value=0),),
     )
 
-    context: Context = {
-        "x": None,
-    }
+    context: Context = {"x"}
 
     check_term(term, context)
 
@@ -160,7 +234,7 @@ def test_check_term_apply():
 def test_check_term_immediate():
     term = Immediate(value=0)
 
-    context: Context = {}
+    context: Context = set()
 
     check_term(term, context)
 
@@ -172,7 +246,7 @@ def test_check_term_primitive():
         right=Immediate(value=2),
     )
 
-    context: Context = {}
+    context: Context = set()
 
     check_term(term, context)
 
@@ -186,7 +260,7 @@ def test_check_term_branch():
         otherwise=Immediate(value=1),
     )
 
-    context: Context = {}
+    context: Context = set()
 
     check_term(term, context)
 
@@ -194,7 +268,7 @@ def test_check_term_branch():
 def test_check_term_allocate():
     term = Allocate(count=0)
 
-    context: Context = {}
+    context: Context = set()
 
     check_term(term, context)
 
@@ -205,9 +279,7 @@ def test_check_term_load():
         index=0,
     )
 
-    context: Context = {
-        "x": None,
-    }
+    context: Context = {"x"}
 
     check_term(term, context)
 
@@ -219,20 +291,18 @@ def test_check_term_store():
         value=Immediate(value=0),
     )
 
-    context: Context = {
-        "x": None,
-    }
+    context: Context = {"x"}
 
     check_term(term, context)
 
 
 def test_check_term_begin():
     term = Begin(
-        effects=[Immediate(value=0)],
+        effects=(Immediate(value=0),),
         value=Immediate(value=0),
     )
 
-    context: Context = {}
+    context: Context = set()
 
     check_term(term, context)
 
@@ -253,4 +323,19 @@ def test_check_program_duplicate_parameters():
     )
 
     with pytest.raises(ValueError):
-        check_program(program)
\ No newline at end of file
+        check_program(program)
+
+
+def test_check_term_invalid_term_raises_type_error():
+    with pytest.raises(TypeError, match="Unhandled L3 term"):
+        check_term(object(), set())
+
+
+def test_check_term_deep_nesting():
+    term = Immediate(value=0)
+    for _ in range(10_000):
+        term = Primitive(operator="+", left=term, right=Immediate(value=1))
+
+    context: Context = set()
+
+    check_term(term, context)
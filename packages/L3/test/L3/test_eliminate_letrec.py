@@ -10,7 +10,7 @@ def test_eliminate_letrec_term_let():
         body=L3.Reference(name="y"),
     )
 
-    context: Context = {}
+    context: Context = set()
     actual = eliminate_letrec_term(term, context)
 
     expected = L2.Let(
@@ -27,19 +27,19 @@ def test_eliminate_letrec_term_letrec():
         body=L3.Reference(name="z"),
     )
 
-    context: Context = {}
+    context: Context = set()
     actual = eliminate_letrec_term(term, context)
 
     expected = L2.Let(
         bindings=[("x", L2.Allocate(count=1))],
         body=L2.Begin(
-            effects=[
+            effects=(
                 L2.Store(
                     base=L2.Reference(name="x"),
                     index=0,
                     value=L2.Reference(name="y"),
-                )
-            ],
+                ),
+            ),
             value=L2.Reference(name="z"),
         ),
     )
@@ -47,10 +47,56 @@ def test_eliminate_letrec_term_letrec():
     assert actual == expected
 
 
+def test_eliminate_letrec_term_letrec_nested():
+    term = L3.LetRec(
+        bindings=[("f", L3.Reference(name="f"))],
+        body=L3.LetRec(
+            bindings=[("g", L3.Reference(name="f"))],
+            body=L3.Reference(name="g"),
+        ),
+    )
+
+    context: Context = set()
+    actual = eliminate_letrec_term(term, context)
+
+    expected = L2.Let(
+        bindings=[("f", L2.Allocate(count=1))],
+        body=L2.Begin(
+            effects=(
+                L2.Store(
+                    base=L2.Reference(name="f"),
+                    index=0,
+                    value=L2.Load(base=L2.Reference(name="f"), index=0),
+                ),
+            ),
+            value=L2.Let(
+                bindings=[("g", L2.Allocate(count=1))],
+                body=L2.Begin(
+                    effects=(
+                        L2.Store(
+                            base=L2.Reference(name="g"),
+                            index=0,
+                            value=L2.Load(base=L2.Reference(name="f"), index=0),
+                        ),
+                    ),
+                    value=L2.Load(base=L2.Reference(name="g"), index=0),
+                ),
+            ),
+        ),
+    )
+
+    assert actual == expected
+
+    assert isinstance(actual, L2.Let) and isinstance(actual.body, L2.Begin)
+    inner = actual.body.value
+    assert isinstance(inner, L2.Let)
+    assert actual.bindings[0][1] is inner.bindings[0][1]
+
+
 def test_eliminate_letrec_term_reference_value():
     term = L3.Reference(name="x")
 
-    context: Context = {}
+    context: Context = set()
     actual = eliminate_letrec_term(term, context)
 
     expected = L2.Reference(name="x")
@@ -61,7 +107,7 @@ def test_eliminate_letrec_term_reference_value():
 def test_eliminate_letrec_term_reference_variable():
     term = L3.Reference(name="x")
 
-    context: Context = {"x": None}
+    context: Context = {"x"}
     actual = eliminate_letrec_term(term, context)
 
     expected = L2.Load(base=L2.Reference(name="x"), index=0)
@@ -75,7 +121,7 @@ def test_eliminate_letrec_term_abstract():
         body=L3.Reference(name="x"),
     )
 
-    context: Context = {}
+    context: Context = set()
     actual = eliminate_letrec_term(term, context)
 
     expected = L2.Abstract(
@@ -89,15 +135,32 @@ def test_eliminate_letrec_term_abstract():
 def test_eliminate_letrec_term_apply():
     term = L3.Apply(
         target=L3.Reference(name="x"),
-        arguments=[],
+        arguments=(),
     )
 
-    context: Context = {}
+    context: Context = set()
     actual = eliminate_letrec_term(term, context)
 
     expected = L2.Apply(
         target=L2.Reference(name="x"),
-        arguments=[],
+        arguments=(),
+    )
+
+    assert actual == expected
+
+
+def test_eliminate_letrec_term_apply_arguments():
+    term = L3.Apply(
+        target=L3.Reference(name="f"),
+        arguments=(L3.Reference(name="x"), L3.Immediate(value=0)),
+    )
+
+    context: Context = {"f"}
+    actual = eliminate_letrec_term(term, context)
+
+    expected = L2.Apply(
+        target=L2.Load(base=L2.Reference(name="f"), index=0),
+        arguments=(L2.Reference(name="x"), L2.Immediate(value=0)),
     )
 
     assert actual == expected
@@ -106,7 +169,7 @@ def test_eliminate_letrec_term_apply():
 def test_eliminate_letrec_term_immediate():
     term = L3.Immediate(value=0)
 
-    context: Context = {}
+    context: Context = set()
     actual = eliminate_letrec_term(term, context)
 
     expected = L2.Immediate(value=0)
@@ -121,7 +184,7 @@ def test_eliminate_letrec_term_primitive():
         right=L3.Reference(name="y"),
     )
 
-    context: Context = {}
+    context: Context = set()
     actual = eliminate_letrec_term(term, context)
 
     expected = L2.Primitive(
@@ -142,7 +205,7 @@ def test_eliminate_letrec_term_branch():
         otherwise=L3.Reference(name="z"),
     )
 
-    context: Context = {}
+    context: Context = set()
     actual = eliminate_letrec_term(term, context)
 
     expected = L2.Branch(
@@ -159,7 +222,7 @@ def test_eliminate_letrec_term_branch():
 def test_eliminate_letrec_term_allocate():
     term = L3.Allocate(count=3)
 
-    context: Context = {}
+    context: Context = set()
     actual = eliminate_letrec_term(term, context)
 
     expected = L2.Allocate(count=3)
@@ -173,7 +236,7 @@ def test_eliminate_letrec_term_load():
         index=0,
     )
 
-    context: Context = {}
+    context: Context = set()
     actual = eliminate_letrec_term(term, context)
 
     expected = L2.Load(
@@ -191,7 +254,7 @@ def test_eliminate_letrec_term_store():
         value=L3.Reference(name="y"),
     )
 
-    context: Context = {}
+    context: Context = set()
     actual = eliminate_letrec_term(term, context)
 
     expected = L2.Store(
@@ -205,21 +268,103 @@ def test_eliminate_letrec_term_store():
 
 def test_eliminate_letrec_term_begin():
     term = L3.Begin(
-        effects=[],
+        effects=(),
         value=L3.Reference(name="x"),
     )
 
-    context: Context = {}
+    context: Context = set()
     actual = eliminate_letrec_term(term, context)
 
     expected = L2.Begin(
-        effects=[],
+        effects=(),
         value=L2.Reference(name="x"),
     )
 
     assert actual == expected
 
-    context: Context = {"f": None}
+    context: Context = {"f"}
+
+
+def test_eliminate_letrec_term_begin_effects():
+    term = L3.Begin(
+        effects=(L3.Reference(name="x"), L3.Immediate(value=0)),
+        value=L3.Reference(name="y"),
+    )
+
+    context: Context = set()
+    actual = eliminate_letrec_term(term, context)
+
+    expected = L2.Begin(
+        effects=(L2.Reference(name="x"), L2.Immediate(value=0)),
+        value=L2.Reference(name="y"),
+    )
+
+    assert actual == expected
+
+
+def test_eliminate_letrec_term_shared_subterm():
+    shared = L3.Primitive(
+        operator="+",
+        left=L3.Reference(name="f"),
+        right=L3.Immediate(value=1),
+    )
+    term = L3.Begin(
+        effects=(shared,),
+        value=L3.LetRec(
+            bindings=[("f", shared)],
+            body=shared,
+        ),
+    )
+
+    context: Context = set()
+    actual = eliminate_letrec_term(term, context)
+
+    outer = L2.Primitive(
+        operator="+",
+        left=L2.Reference(name="f"),
+        right=L2.Immediate(value=1),
+    )
+    inner = L2.Primitive(
+        operator="+",
+        left=L2.Load(base=L2.Reference(name="f"), index=0),
+        right=L2.Immediate(value=1),
+    )
+    expected = L2.Begin(
+        effects=(outer,),
+        value=L2.Let(
+            bindings=[("f", L2.Allocate(count=1))],
+            body=L2.Begin(
+                effects=(L2.Store(base=L2.Reference(name="f"), index=0, value=inner),),
+                value=inner,
+            ),
+        ),
+    )
+
+    assert actual == expected
+
+    letrec = actual.value
+    assert isinstance(letrec, L2.Let) and isinstance(letrec.body, L2.Begin)
+    (store,) = letrec.body.effects
+    assert isinstance(store, L2.Store)
+    assert store.value is letrec.body.value
+
+
+def test_eliminate_letrec_term_deep_nesting():
+    term = L3.Immediate(value=0)
+    for _ in range(10_000):
+        term = L3.Load(base=term, index=0)
+
+    context: Context = set()
+    actual = eliminate_letrec_term(term, context)
+
+    depth = 0
+    while isinstance(actual, L2.Load):
+        actual = actual.base
+        depth += 1
+
+    assert depth == 10_000
+    assert actual == L2.Immediate(value=0)
+
 
 def test_eliminate_letrec_program():
     program = L3.Program(
@@ -236,6 +381,7 @@ def test_eliminate_letrec_program():
 
     assert actual == expected
 
+
 def test_eliminate_letrec_term_invalid_term_raises_type_error():
     with pytest.raises(TypeError, match="Unhandled L3 term"):
-        eliminate_letrec_term(object(), {})
\ No newline at end of file
+        eliminate_letrec_term(object(), set())
@@ -1,3 +1,5 @@
+import sys
+
 from L3.parse import parse_program, parse_term
 from L3.syntax import (
     Abstract,
@@ -87,6 +89,18 @@ def test_parse_reference():
     assert actual == expected
 
 
+def test_parse_reference_interned():
+    source = "(let ((name 0)) name)"
+
+    actual = parse_term(source)
+
+    assert isinstance(actual, Let)
+    (binder, _), *_ = actual.bindings
+    assert binder is sys.intern("name")
+    assert actual.body == Reference(name="name")
+    assert actual.body.name is binder
+
+
 # Abstract
 def test_parse_abstract():
     source = "(\\ (x) x)"
@@ -107,7 +121,7 @@ def test_parse_apply_empty():
 
     expected = Apply(
         target=Reference(name="x"),
-        arguments=[],
+        arguments=(),
     )
 
     actual = parse_term(source)
@@ -120,7 +134,7 @@ def test_parse_apply_arguments():
 
     expected = Apply(
         target=Reference(name="x"),
-        arguments=[Reference(name="y"), Reference(name="z")],
+        arguments=(Reference(name="y"), Reference(name="z")),
     )
 
     actual = parse_term(source)
@@ -258,7 +272,7 @@ def test_parse_begin():
     source = "(begin x)"
 
     expected = Begin(
-        effects=[],
+        effects=(),
         value=Reference(name="x"),
     )
 
@@ -271,10 +285,10 @@ def test_parse_begin_effects():
     source = "(begin x y z)"
 
     expected = Begin(
-        effects=[
+        effects=(
             Reference(name="x"),
             Reference(name="y"),
-        ],
+        ),
         value=Reference(name="z"),
     )
 
@@ -50,9 +50,7 @@ def test_uniqify_term_let():
         ],
         body=Apply(
             target=Reference(name="x"),
-            arguments=[
-                Reference(name="y"),
-            ],
+            arguments=(Reference(name="y"),),
         ),
     )
 
@@ -67,9 +65,7 @@ def test_uniqify_term_let():
         ],
         body=Apply(
             target=Reference(name="x0"),
-            arguments=[
-                Reference(name="y0"),
-            ],
+            arguments=(Reference(name="y0"),),
         ),
     )
 
@@ -85,7 +81,7 @@ def test_uniqify_term_letrec():
                     parameters=["x"],
                     body=Apply(
                         target=Reference(name="f"),
-                        arguments=[Reference(name="x")],
+                        arguments=(Reference(name="x"),),
                     ),
                 ),
             )
@@ -104,7 +100,7 @@ def test_uniqify_term_letrec():
                     parameters=["x0"],
                     body=Apply(
                         target=Reference(name="f0"),
-                        arguments=[Reference(name="x0")],
+                        arguments=(Reference(name="x0"),),
                     ),
                 ),
             )
@@ -117,7 +113,7 @@ def test_uniqify_term_letrec():
 
 def test_uniqify_term_structural_forms():
     term = Begin(
-        effects=[
+        effects=(
             Store(
                 base=Reference(name="vec"),
                 index=0,
@@ -126,8 +122,8 @@ def test_uniqify_term_structural_forms():
                     left=Reference(name="x"),
                     right=Immediate(value=1),
                 ),
-            )
-        ],
+            ),
+        ),
         value=Branch(
             operator="==",
             left=Load(base=Reference(name="vec"), index=0),
@@ -135,7 +131,7 @@ def test_uniqify_term_structural_forms():
             consequent=Reference(name="x"),
             otherwise=Apply(
                 target=Reference(name="f"),
-                arguments=[Reference(name="x")],
+                arguments=(Reference(name="x"),),
             ),
         ),
     )
@@ -145,7 +141,7 @@ def test_uniqify_term_structural_forms():
     actual = uniqify_term(term, context, fresh)
 
     expected = Begin(
-        effects=[
+        effects=(
             Store(
                 base=Reference(name="vec7"),
                 index=0,
@@ -154,8 +150,8 @@ def test_uniqify_term_structural_forms():
                     left=Reference(name="x3"),
                     right=Immediate(value=1),
                 ),
-            )
-        ],
+            ),
+        ),
         value=Branch(
             operator="==",
             left=Load(base=Reference(name="vec7"), index=0),
@@ -163,7 +159,7 @@ def test_uniqify_term_structural_forms():
             consequent=Reference(name="x3"),
             otherwise=Apply(
                 target=Reference(name="f9"),
-                arguments=[Reference(name="x3")],
+                arguments=(Reference(name="x3"),),
             ),
         ),
     )
@@ -183,14 +179,14 @@ def test_uniqify_program_renames_parameters_and_nested_binders():
                         parameters=["f"],
                         body=Apply(
                             target=Reference(name="f"),
-                            arguments=[Reference(name="x")],
+                            arguments=(Reference(name="x"),),
                         ),
                     ),
                 ),
             ],
             body=Apply(
                 target=Reference(name="g"),
-                arguments=[Reference(name="f")],
+                arguments=(Reference(name="f"),),
             ),
         ),
     )
@@ -208,14 +204,14 @@ def test_uniqify_program_renames_parameters_and_nested_binders():
                         parameters=["f1"],
                         body=Apply(
                             target=Reference(name="f1"),
-                            arguments=[Reference(name="x0")],
+                            arguments=(Reference(name="x0"),),
                         ),
                     ),
                 ),
             ],
             body=Apply(
                 target=Reference(name="g0"),
-                arguments=[Reference(name="f0")],
+                arguments=(Reference(name="f0"),),
             ),
         ),
     )
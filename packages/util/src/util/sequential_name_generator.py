@@ -1,3 +1,4 @@
+import sys
 from collections import defaultdict
 
 
@@ -8,4 +9,4 @@ class SequentialNameGenerator:
     def __call__(self, candidate: str) -> str:
         current: int = self._counters[candidate]
         self._counters[candidate] += 1
-        return f"{candidate}{current}"
+        return sys.intern(f"{candidate}{current}")
@@ -0,0 +1,15 @@
+import sys
+
+from util.sequential_name_generator import SequentialNameGenerator
+
+
+def test_sequential_name_generator_numbers_candidates():
+    fresh = SequentialNameGenerator()
+
+    assert [fresh("x"), fresh("y"), fresh("x")] == ["x0", "y0", "x1"]
+
+
+def test_sequential_name_generator_interns_names():
+    fresh = SequentialNameGenerator()
+
+    assert fresh("x") is sys.intern("x0")